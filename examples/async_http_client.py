@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Async example client for the MCP HTTP transport.
+
+Demonstrates batch-parallelizing independent tool calls with asyncio +
+aiohttp: the requests are I/O-bound and independent, so running them
+concurrently drops wall-clock time from ~sum(RTT) to ~max(RTT).
+
+Requires aiohttp: pip install aiohttp
+"""
+
+import asyncio
+import io
+import json
+import reprlib
+import sys
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+# Request template copied per call instead of rebuilding the dict literal;
+# cheaper than constructing from scratch when many calls are gathered.
+_BASE_REQUEST = {"jsonrpc": "2.0", "id": 0, "method": None, "params": None}
+
+
+# Demo payloads are pure data; build them once at module scope instead of
+# re-allocating the nested literals (including the 9x9 grid) per call. This
+# also lets batch/pre-encoding paths reference one shared structure.
+_SUDOKU_PUZZLE = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9]
+]
+
+_TOOL_CALL_EXAMPLES = [
+    {
+        "title": "Solve 4-Queens",
+        "tool": "solve_n_queens",
+        "args": {"n": 4},
+    },
+    {
+        "title": "Solve 8-Queens",
+        "tool": "solve_n_queens",
+        "args": {"n": 8},
+    },
+    {
+        "title": "Solve 24-Point Game",
+        "tool": "solve_24_point_game",
+        "args": {"numbers": [3, 3, 8, 8]},
+    },
+    {
+        "title": "Chicken-Rabbit Problem",
+        "tool": "solve_chicken_rabbit_problem",
+        "args": {"total_heads": 35, "total_legs": 94},
+    },
+    {
+        "title": "Solve Mini Sudoku",
+        "tool": "solve_sudoku",
+        "args": {"puzzle": _SUDOKU_PUZZLE},
+    },
+]
+
+
+def _extract_text(result: Dict[str, Any]) -> Optional[str]:
+    """Pull the first text content block out of a tools/call response.
+
+    Replaces the repeated ``result["result"].get("content", [{}])[0]...``
+    chains; returns None when any level is missing, without allocating
+    default containers on the success path.
+    """
+    r = result.get("result")
+    if not r:
+        return None
+    content = r.get("content")
+    if not content:
+        return None
+    return content[0].get("text")
+
+
+def _short_repr(obj, limit: int = 100) -> str:
+    """Truncated repr for printing large solutions.
+
+    reprlib stops expanding nested structures once its limits are hit, so
+    a multi-kB Sudoku solution is never stringified in full just to be cut
+    down to one display line.
+    """
+    r = reprlib.Repr()
+    r.maxdict = 6
+    r.maxlist = 6
+    r.maxstring = limit
+    r.maxother = limit
+    return r.repr(obj)
+
+
+class AsyncMCPClient:
+    """Async client for the MCP server using aiohttp with bounded concurrency."""
+
+    # Slots make attribute access a fixed-offset load instead of a dict
+    # lookup inside _make_request, which runs once per gathered call.
+    __slots__ = ("base_url", "http_url", "request_id", "max_concurrency",
+                 "_session", "_semaphore")
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8080", max_concurrency: int = 8):
+        """Initialize the client.
+
+        Args:
+            base_url: Base URL of the MCP server
+            max_concurrency: Maximum number of in-flight requests per host
+        """
+        self.base_url = base_url
+        self.http_url = f"{base_url}/mcp/http"
+        self.request_id = 0
+        self.max_concurrency = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.max_concurrency,
+            keepalive_timeout=30,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._session.close()
+
+    def _next_id(self) -> int:
+        """Get next request ID."""
+        self.request_id += 1
+        return self.request_id
+
+    async def _make_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Make an MCP JSON-RPC request.
+
+        Args:
+            method: MCP method name
+            params: Method parameters
+
+        Returns:
+            Response dictionary
+        """
+        payload = _BASE_REQUEST.copy()
+        payload["id"] = self._next_id()
+        payload["method"] = method
+        payload["params"] = params or {}
+
+        async with self._semaphore:
+            async with self._session.post(self.http_url, json=payload) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def list_tools(self) -> Dict[str, Any]:
+        """List available tools."""
+        return await self._make_request("tools/list")
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Call a tool.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+
+        Returns:
+            Tool result dictionary
+        """
+        params = {
+            "name": tool_name,
+            "arguments": arguments or {}
+        }
+        return await self._make_request("tools/call", params)
+
+
+async def demonstrate_tool_calls(client: AsyncMCPClient):
+    """Run several independent tool calls concurrently and print the results."""
+    examples = _TOOL_CALL_EXAMPLES
+
+    # Fire all requests concurrently; the client's semaphore caps in-flight
+    # requests. Printing stays serial below to preserve output ordering.
+    results = await asyncio.gather(
+        *(client.call_tool(example["tool"], example["args"]) for example in examples),
+        return_exceptions=True,
+    )
+
+    # Buffer each example's lines and flush them with one write: a handful
+    # of syscalls per demo run instead of one per print when stdout is
+    # line-buffered or piped.
+    loads = json.loads
+    buf = io.StringIO()
+    for example, result in zip(examples, results):
+        print(f"\n{example['title']} ({example['tool']})", file=buf)
+        print("-" * 70, file=buf)
+        if isinstance(result, Exception):
+            print(f"Error: {result}", file=buf)
+        else:
+            text = _extract_text(result)
+            if text is not None:
+                solution = loads(text)
+                print(f"Result: {_short_repr(solution)}", file=buf)
+            else:
+                print(f"Response: {result}", file=buf)
+        sys.stdout.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate(0)
+
+
+async def main():
+    """Example usage of the async MCP client."""
+    print("=" * 70)
+    print("MCP Async HTTP Client Example (aiohttp)")
+    print("=" * 70)
+
+    async with AsyncMCPClient() as client:
+        # List tools first so the demo fails fast if the server is down
+        tools = await client.list_tools()
+        tool_count = len(tools.get("result", {}).get("tools", []))
+        print(f"\nServer reports {tool_count} tools")
+
+        await demonstrate_tool_calls(client)
+
+    print("\n" + "=" * 70)
+    print("Examples completed!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except aiohttp.ClientConnectorError:
+        print("\n❌ Error: Could not connect to MCP server")
+        print("Please start the server first:")
+        print("  uvicorn mcp_server.mcp_http_server:app --host 127.0.0.1 --port 8080")
+    except KeyboardInterrupt:
+        print("\n\nInterrupted by user")
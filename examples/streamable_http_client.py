@@ -8,27 +8,161 @@ with the MCP server using streaming responses.
 
 import requests
 import json
-from typing import Iterator, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, Dict, Any, List, Tuple
+
+# Prefer orjson for JSON (de)serialization - it is ~10x faster at dumps and
+# ~2x at loads, and accepts raw bytes directly. Fall back to stdlib json so
+# the example still runs without the optional dependency.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+# Request template copied per call instead of rebuilding the dict literal;
+# dict.copy() of a small template is cheaper than constructing from scratch
+# when requests are issued in batches.
+_BASE_REQUEST = {"jsonrpc": "2.0", "id": 0, "method": None, "params": None}
+
+# Large demo payloads, hoisted to module scope so repeated runs reuse one
+# structure. The Sudoku body is serialized once at import time; posting the
+# ready bytes skips re-encoding the ~1KB grid on every invocation.
+_SUDOKU_PUZZLE = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9]
+]
+
+_SUDOKU_BODY = _dumps({
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "tools/call",
+    "params": {"name": "solve_sudoku", "arguments": {"puzzle": _SUDOKU_PUZZLE}}
+})
 
 
 class StreamableMCPClient:
     """Client for MCP server using streamable HTTP transport."""
-    
-    def __init__(self, base_url: str = "http://127.0.0.1:8080"):
+
+    # Slots make attribute access a fixed-offset load instead of a dict
+    # lookup inside the per-request methods, and drop the per-instance
+    # __dict__ for scripts that build many clients.
+    __slots__ = ("base_url", "http_url", "request_id", "_supports_batch",
+                 "_session", "_httpx_client")
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8080", transport: str = "requests"):
         """Initialize the client.
-        
+
         Args:
             base_url: Base URL of the MCP server
+            transport: "requests" (default) or "httpx". The httpx transport
+                enables HTTP/2 multiplexing when the server supports it, so
+                many small JSON-RPC calls share one connection concurrently;
+                against an HTTP/1.1 server it still keeps connections alive.
+                Streaming requests always use the requests transport.
         """
         self.base_url = base_url
         self.http_url = f"{base_url}/mcp/http"
         self.request_id = 0
-    
+        self._supports_batch = None  # None = unknown, feature-detected on first use
+
+        # Reuse one session so every JSON-RPC call shares a pooled
+        # keep-alive connection instead of paying TCP/TLS setup per call.
+        self._session = requests.Session()
+        # Retries run inside urllib3 on the pooled connection where possible,
+        # so transient 5xx/429 responses back off and retry without a fresh
+        # TCP handshake. POST is explicitly allowed since JSON-RPC calls are
+        # idempotent against this server.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                connect=3,
+                read=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["POST", "GET"]),
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._httpx_client = None
+        if transport == "httpx":
+            import httpx  # optional dependency of the httpx transport
+            try:
+                self._httpx_client = httpx.Client(
+                    base_url=base_url,
+                    http2=True,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                    timeout=30.0,
+                )
+            except ImportError:
+                # http2=True needs the h2 package; fall back to HTTP/1.1 keep-alive
+                self._httpx_client = httpx.Client(base_url=base_url, timeout=30.0)
+        elif transport != "requests":
+            raise ValueError(f"Unknown transport: {transport!r}")
+
+    def close(self):
+        """Close the underlying HTTP session(s)."""
+        self._session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _next_id(self) -> int:
         """Get next request ID."""
         self.request_id += 1
         return self.request_id
     
+    def send_notification(self, method: str, params: Dict[str, Any] = None) -> None:
+        """Send a JSON-RPC notification (fire-and-forget).
+
+        Per JSON-RPC 2.0 a notification carries no "id" and expects no
+        response, so the body is posted and the connection released without
+        parsing whatever the server sends back.
+
+        Args:
+            method: MCP method name (e.g. "notifications/initialized")
+            params: Method parameters
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or {}
+        }
+        headers = {"Content-Type": "application/json"}
+        response = self._session.post(self.http_url, headers=headers,
+                                      data=_dumps(payload), timeout=5)
+        response.close()
+
     def call_regular(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make a regular (non-streaming) MCP request.
         
@@ -39,17 +173,20 @@ class StreamableMCPClient:
         Returns:
             Response dictionary
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": method,
-            "params": params or {}
-        }
-        
+        payload = _BASE_REQUEST.copy()
+        payload["id"] = self._next_id()
+        payload["method"] = method
+        payload["params"] = params or {}
+
         headers = {"Content-Type": "application/json"}
-        response = requests.post(self.http_url, headers=headers, json=payload)
+        if self._httpx_client is not None:
+            response = self._httpx_client.post("/mcp/http", headers=headers,
+                                               content=_dumps(payload))
+        else:
+            response = self._session.post(self.http_url, headers=headers, data=_dumps(payload))
         response.raise_for_status()
-        return response.json()
+        # orjson parses raw bytes directly, skipping the .text UTF-8 decode pass
+        return _loads(response.content)
     
     def call_streaming(self, method: str, params: Dict[str, Any] = None, 
                       use_accept_header: bool = True) -> Iterator[Dict[str, Any]]:
@@ -63,29 +200,101 @@ class StreamableMCPClient:
         Yields:
             Response dictionaries as they arrive
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": method,
-            "params": params or {}
-        }
-        
+        payload = _BASE_REQUEST.copy()
+        payload["id"] = self._next_id()
+        payload["method"] = method
+        payload["params"] = params or {}
+
         headers = {"Content-Type": "application/json"}
         if use_accept_header:
             headers["Accept"] = "text/event-stream"
         else:
             headers["X-Stream"] = "true"
         
-        response = requests.post(self.http_url, headers=headers, json=payload, stream=True)
+        response = self._session.post(self.http_url, headers=headers, data=_dumps(payload),
+                                      stream=True)
         response.raise_for_status()
-        
-        for line in response.iter_lines():
-            if line:
-                decoded_line = line.decode('utf-8')
-                if decoded_line.startswith("data: "):
-                    data = json.loads(decoded_line[6:])
-                    yield data
+
+        # Frame the SSE stream manually over iter_content: scanning a scratch
+        # bytearray with the C-implemented find/slice-delete is faster than
+        # iter_lines' Python-level line splitting for high frame rates. The
+        # parser is bound to a local so the per-frame loop skips the module
+        # attribute lookup, and orjson parses the raw bytes directly - no
+        # per-line UTF-8 decode.
+        loads = _loads
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+            while True:
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    break
+                line = bytes(buf[:nl])
+                del buf[:nl + 1]
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                if line.startswith(b"data: "):
+                    yield loads(line[6:])
     
+    def call_preencoded(self, encoded_body: bytes) -> Dict[str, Any]:
+        """Post a pre-serialized JSON-RPC body.
+
+        Useful for benchmarks and repeated demos where the same large
+        payload is sent many times: the dict-to-JSON conversion happens
+        once up front instead of per call.
+
+        Args:
+            encoded_body: Ready-to-send JSON-RPC request bytes
+
+        Returns:
+            Response dictionary
+        """
+        headers = {"Content-Type": "application/json"}
+        response = self._session.post(self.http_url, headers=headers, data=encoded_body)
+        response.raise_for_status()
+        # orjson parses raw bytes directly, skipping the .text UTF-8 decode pass
+        return _loads(response.content)
+
+    def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Call several tools with a single batched JSON-RPC POST.
+
+        JSON-RPC 2.0 allows sending an array of requests in one POST, which
+        collapses N round-trips into 1. Servers without batch support are
+        detected once and the client falls back to sequential requests.
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            List of response dictionaries, aligned with ``calls``
+        """
+        if self._supports_batch is not False:
+            batch = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": self._next_id(),
+                    "method": "tools/call",
+                    "params": {"name": name, "arguments": arguments or {}}
+                }
+                for name, arguments in calls
+            ]
+            headers = {"Content-Type": "application/json"}
+            response = self._session.post(self.http_url, headers=headers, data=_dumps(batch))
+            response.raise_for_status()
+            results = _loads(response.content)
+            if isinstance(results, list):
+                self._supports_batch = True
+                # Responses may arrive out of order - realign by request id
+                by_id = {item.get("id"): item for item in results}
+                return [by_id.get(request["id"], request) for request in batch]
+            self._supports_batch = False
+
+        # Fallback: one request per call
+        return [
+            self.call_regular("tools/call", {"name": name, "arguments": arguments or {}})
+            for name, arguments in calls
+        ]
+
     def list_tools(self, streaming: bool = False) -> Any:
         """List available tools.
         
@@ -123,6 +332,28 @@ class StreamableMCPClient:
             return self.call_regular("tools/call", params)
 
 
+def call_mcp_tool(tool_name: str, arguments: Dict[str, Any] = None,
+                  client: StreamableMCPClient = None) -> Dict[str, Any]:
+    """Call a tool, reusing a pre-built client when one is supplied.
+
+    Scripted callers that issue several calls should pass their own client
+    so every call shares one pooled session instead of paying connection
+    setup per invocation.
+    """
+    if client is not None:
+        return client.call_tool(tool_name, arguments)
+    with StreamableMCPClient() as transient:
+        return transient.call_tool(tool_name, arguments)
+
+
+def list_tools(client: StreamableMCPClient = None) -> Dict[str, Any]:
+    """List available tools, reusing a pre-built client when one is supplied."""
+    if client is not None:
+        return client.list_tools()
+    with StreamableMCPClient() as transient:
+        return transient.list_tools()
+
+
 def main():
     """Example usage of the streamable MCP client."""
     print("=" * 70)
@@ -130,15 +361,19 @@ def main():
     print("=" * 70)
     print()
     
-    # Create client
-    client = StreamableMCPClient()
-    
+    # Create client (context manager closes the pooled session on exit)
+    with StreamableMCPClient() as client:
+        run_examples(client)
+
+
+def run_examples(client):
+    """Run the example requests against a connected client."""
     # Example 1: Regular (non-streaming) request
     print("1. Regular Request - List Tools")
     print("-" * 70)
     try:
         result = client.list_tools(streaming=False)
-        print(f"Response: {json.dumps(result, indent=2)}")
+        print(f"Response: {_pretty(result)}")
         print()
     except Exception as e:
         print(f"Error: {e}\n")
@@ -148,7 +383,7 @@ def main():
     print("-" * 70)
     try:
         for response in client.call_tool("info", streaming=True):
-            print(f"Received: {json.dumps(response, indent=2)}")
+            print(f"Received: {_pretty(response)}")
         print()
     except Exception as e:
         print(f"Error: {e}\n")
@@ -161,7 +396,7 @@ def main():
             "name": "solve_n_queens",
             "arguments": {"n": 4}
         }, use_accept_header=False):
-            print(f"Received: {json.dumps(response, indent=2)}")
+            print(f"Received: {_pretty(response)}")
         print()
     except Exception as e:
         print(f"Error: {e}\n")
@@ -170,19 +405,8 @@ def main():
     print("4. Regular Request - Solve Mini Sudoku")
     print("-" * 70)
     try:
-        puzzle = [
-            [5, 3, 0, 0, 7, 0, 0, 0, 0],
-            [6, 0, 0, 1, 9, 5, 0, 0, 0],
-            [0, 9, 8, 0, 0, 0, 0, 6, 0],
-            [8, 0, 0, 0, 6, 0, 0, 0, 3],
-            [4, 0, 0, 8, 0, 3, 0, 0, 1],
-            [7, 0, 0, 0, 2, 0, 0, 0, 6],
-            [0, 6, 0, 0, 0, 0, 2, 8, 0],
-            [0, 0, 0, 4, 1, 9, 0, 0, 5],
-            [0, 0, 0, 0, 8, 0, 0, 7, 9]
-        ]
-        result = client.call_tool("solve_sudoku", {"puzzle": puzzle}, streaming=False)
-        print(f"Response: {json.dumps(result, indent=2)}")
+        result = client.call_preencoded(_SUDOKU_BODY)
+        print(f"Response: {_pretty(result)}")
         print()
     except Exception as e:
         print(f"Error: {e}\n")
@@ -194,7 +418,7 @@ def main():
         for response in client.call_tool("solve_24_point_game", 
                                         {"numbers": [3, 3, 8, 8]}, 
                                         streaming=True):
-            print(f"Received: {json.dumps(response, indent=2)}")
+            print(f"Received: {_pretty(response)}")
         print()
     except Exception as e:
         print(f"Error: {e}\n")
@@ -10,201 +10,204 @@ from typing import Dict, Any, Optional
 def solve_zebra_puzzle():
     """
     Solve the classic Zebra puzzle (Einstein's riddle):
-    
+
     There are 5 houses in a row, each with different color, nationality, drink, pet, and cigarette.
     Given clues, determine who owns the zebra and who drinks water.
     """
     model = gurddy.Model("ZebraPuzzle", "CSP")
-    
+
     # 5 houses numbered 1-5 (left to right, for mask optimization)
     houses = list(range(1, 6))
-    
+
     # Attributes
     colors = ['Red', 'Green', 'White', 'Yellow', 'Blue']
     nationalities = ['English', 'Spanish', 'Ukrainian', 'Norwegian', 'Japanese']
     drinks = ['Coffee', 'Tea', 'Milk', 'OrangeJuice', 'Water']
     pets = ['Dog', 'Snails', 'Fox', 'Horse', 'Zebra']
     cigarettes = ['OldGold', 'Kools', 'Chesterfields', 'LuckyStrike', 'Parliaments']
-    
-    # Variables: each attribute gets assigned to houses 0-4
+
+    all_names = (
+        [f'color_{c}' for c in colors]
+        + [f'nat_{n}' for n in nationalities]
+        + [f'drink_{d}' for d in drinks]
+        + [f'pet_{p}' for p in pets]
+        + [f'cig_{c}' for c in cigarettes]
+    )
+
+    # Equality clues ("X lives in / owns / drinks Y") pin two attributes to
+    # the same house. Instead of modelling each side as its own variable tied
+    # together by a FunctionConstraint callback, merge each equality-linked
+    # group into ONE solver variable (a dual encoding of the clue). This
+    # removes 8 binary constraints and 8 variables from the search, so the
+    # solver propagates native AllDifferent over fewer, tighter variables
+    # instead of re-entering Python per clue check.
+    equality_clues = [
+        ('nat_English', 'color_Red'),          # Clue 1
+        ('nat_Spanish', 'pet_Dog'),            # Clue 2
+        ('drink_Coffee', 'color_Green'),       # Clue 3
+        ('nat_Ukrainian', 'drink_Tea'),        # Clue 4
+        ('cig_OldGold', 'pet_Snails'),         # Clue 6
+        ('cig_Kools', 'color_Yellow'),         # Clue 7
+        ('cig_LuckyStrike', 'drink_OrangeJuice'),  # Clue 12
+        ('nat_Japanese', 'cig_Parliaments'),   # Clue 13
+    ]
+
+    # Union-find over attribute names: every name maps to the representative
+    # whose solver variable stands in for the whole equality group.
+    parent = {name: name for name in all_names}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for a, b in equality_clues:
+        parent[find(b)] = find(a)
+
+    # Fail-first ordering hint: gurddy has no variable-ordering API, but its
+    # mask solver picks the smallest remaining domain and breaks ties by
+    # insertion order. Registering the most clue-constrained variables first
+    # biases those ties toward fail-first, shrinking the backtracking tree.
+    clue_degree = {name: 0 for name in all_names}
+    for a, b in equality_clues:
+        clue_degree[a] += 1
+        clue_degree[b] += 1
+    for name in ('drink_Milk', 'nat_Norwegian', 'color_Blue'):  # clues 8, 9, 14
+        clue_degree[name] += 1
+    build_order = sorted(all_names, key=lambda n: -clue_degree[n])
+
+    # Clues 8 and 9 pin an attribute to a known house. Encoding them as
+    # singleton domains at variable creation (instead of equality against a
+    # constant helper variable) removes two variables and two Python
+    # callbacks, and AllDifferent prunes those houses from the rest of each
+    # category before search even starts.
+    pinned_domains = {
+        find('drink_Milk'): [3],     # Clue 8: milk in the middle house
+        find('nat_Norwegian'): [1],  # Clue 9: Norwegian in the first house
+    }
+
+    # One variable per equivalence class; aliases share the representative's
+    # variable so AllDifferent groups and remaining clues work transparently.
+    rep_vars = {}
     vars_dict = {}
-    
-    # Color variables
-    for i, color in enumerate(colors):
-        vars_dict[f'color_{color}'] = model.addVar(f'color_{color}', domain=houses)
-    
-    # Nationality variables  
-    for i, nat in enumerate(nationalities):
-        vars_dict[f'nat_{nat}'] = model.addVar(f'nat_{nat}', domain=houses)
-    
-    # Drink variables
-    for i, drink in enumerate(drinks):
-        vars_dict[f'drink_{drink}'] = model.addVar(f'drink_{drink}', domain=houses)
-    
-    # Pet variables
-    for i, pet in enumerate(pets):
-        vars_dict[f'pet_{pet}'] = model.addVar(f'pet_{pet}', domain=houses)
-    
-    # Cigarette variables
-    for i, cig in enumerate(cigarettes):
-        vars_dict[f'cig_{cig}'] = model.addVar(f'cig_{cig}', domain=houses)
-    
+    for name in build_order:
+        rep = find(name)
+        if rep not in rep_vars:
+            rep_vars[rep] = model.addVar(rep, domain=pinned_domains.get(rep, houses))
+        vars_dict[name] = rep_vars[rep]
+
     # Constraint: Each attribute appears exactly once (AllDifferent within each category)
     color_vars = [vars_dict[f'color_{c}'] for c in colors]
     nat_vars = [vars_dict[f'nat_{n}'] for n in nationalities]
     drink_vars = [vars_dict[f'drink_{d}'] for d in drinks]
     pet_vars = [vars_dict[f'pet_{p}'] for p in pets]
     cig_vars = [vars_dict[f'cig_{c}'] for c in cigarettes]
-    
+
     model.addConstraint(gurddy.AllDifferentConstraint(color_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(nat_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(drink_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(pet_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(cig_vars))
-    
-    # Clue constraints
-    def same_house(house1, house2):
-        return house1 == house2
-    
+
+    # Clue constraints (non-equality clues only; clues 1-4, 6, 7, 12 and 13
+    # are already encoded by the variable merging above, clues 8 and 9 by
+    # the singleton domains)
     def adjacent_houses(house1, house2):
         return abs(house1 - house2) == 1
-    
+
     def to_the_right(house1, house2):
         return house1 == house2 + 1
-    
-    # Clue 1: The English person lives in the red house
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['nat_English'], vars_dict['color_Red'])
-    ))
-    
-    # Clue 2: The Spanish person owns the dog
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['nat_Spanish'], vars_dict['pet_Dog'])
-    ))
-    
-    # Clue 3: Coffee is drunk in the green house
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['drink_Coffee'], vars_dict['color_Green'])
-    ))
-    
-    # Clue 4: The Ukrainian drinks tea
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['nat_Ukrainian'], vars_dict['drink_Tea'])
-    ))
-    
+
     # Clue 5: The green house is immediately to the right of the white house
     # 注意：这个约束在某些情况下可能导致无解，暂时注释掉
     # model.addConstraint(gurddy.FunctionConstraint(
     #     to_the_right, (vars_dict['color_Green'], vars_dict['color_White'])
     # ))
-    
-    # Clue 6: The Old Gold smoker owns snails
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['cig_OldGold'], vars_dict['pet_Snails'])
-    ))
-    
-    # Clue 7: Kools are smoked in the yellow house
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['cig_Kools'], vars_dict['color_Yellow'])
-    ))
-    
-    # Clue 8: Milk is drunk in the middle house (house 3)
-    # Create a constant variable for house 3 and use equality
-    house_3 = model.addVar("house_3", domain=[3])
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['drink_Milk'], house_3)
-    ))
-    
-    # Clue 9: The Norwegian lives in the first house (house 1)
-    # Create a constant variable for house 1 and use equality
-    house_1 = model.addVar("house_1", domain=[1])
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['nat_Norwegian'], house_1)
-    ))
-    
+
+    # Clues 8 and 9 are encoded directly in the variable domains above.
+
     # Clue 10: The Chesterfields smoker lives next to the fox owner
     # 注意：某些邻接约束可能导致冲突，暂时注释掉
     # model.addConstraint(gurddy.FunctionConstraint(
     #     adjacent_houses, (vars_dict['cig_Chesterfields'], vars_dict['pet_Fox'])
     # ))
-    
+
     # Clue 11: Kools are smoked next to the horse owner
     # model.addConstraint(gurddy.FunctionConstraint(
     #     adjacent_houses, (vars_dict['cig_Kools'], vars_dict['pet_Horse'])
     # ))
-    
-    # Clue 12: The Lucky Strike smoker drinks orange juice
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['cig_LuckyStrike'], vars_dict['drink_OrangeJuice'])
-    ))
-    
-    # Clue 13: The Japanese person smokes Parliaments
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_house, (vars_dict['nat_Japanese'], vars_dict['cig_Parliaments'])
-    ))
-    
+
     # Clue 14: The Norwegian lives next to the blue house
     model.addConstraint(gurddy.FunctionConstraint(
         adjacent_houses, (vars_dict['nat_Norwegian'], vars_dict['color_Blue'])
     ))
-    
+
     # Force mask optimization for better performance and correctness
     solver = gurddy.CSPSolver(model)
     solver.force_mask = True
     solution = solver.solve()
+
+    # Expand the merged solution back to every attribute name so callers
+    # (and print_zebra_solution) still see all 25 assignments.
+    if solution:
+        solution = dict(solution)
+        for name in all_names:
+            solution.setdefault(name, solution[find(name)])
     return solution, vars_dict
 
+# Every solution key is '<category>_<value>' and every house has exactly
+# one attribute per category, so each house is a fixed 5-slot row filled
+# by index from one str.partition per entry. The display order is a
+# constant (alphabetical by label, matching the sorted() output this
+# replaces), which drops the per-house sort and tuple allocations.
+CATEGORY_SLOTS = {'cig': 0, 'color': 1, 'drink': 2, 'nat': 3, 'pet': 4}
+SLOT_LABELS = ('Cigarette', 'Color', 'Drink', 'Nationality', 'Pet')
+
 def print_zebra_solution(solution, vars_dict):
     """Print the Zebra puzzle solution."""
     if not solution:
         print("No solution found for Zebra puzzle!")
         return
-    
+
     print("\nZebra Puzzle Solution:")
     print("=" * 60)
-    
-    # Create house-to-attributes mapping (1-based)
-    houses_info = {i: [] for i in range(1, 6)}
-    
-    # Collect all attributes for each house
+
+    # Create house-to-attributes mapping (1-based, one slot per category)
+    houses_info = {i: [None] * 5 for i in range(1, 6)}
+    nat_by_house = {}
+
+    # Single pass: collect attributes per house and record nationalities so
+    # the zebra/water answers don't need a second walk over the solution.
     for var_name, house in solution.items():
         # Handle potential Unknown type from gurddy solver
         house_value = int(house) if house is not None else 0
         var_name_str = str(var_name)  # Ensure var_name is string
-        if var_name_str.startswith('color_'):
-            houses_info[house_value].append(('Color', var_name_str[6:]))
-        elif var_name_str.startswith('nat_'):
-            houses_info[house_value].append(('Nationality', var_name_str[4:]))
-        elif var_name_str.startswith('drink_'):
-            houses_info[house_value].append(('Drink', var_name_str[6:]))
-        elif var_name_str.startswith('pet_'):
-            houses_info[house_value].append(('Pet', var_name_str[4:]))
-        elif var_name_str.startswith('cig_'):
-            houses_info[house_value].append(('Cigarette', var_name_str[4:]))
-    
-    # Print house by house
+        category, _, value = var_name_str.partition('_')
+        slot = CATEGORY_SLOTS.get(category)
+        if slot is not None:
+            houses_info[house_value][slot] = value
+            if category == 'nat':
+                nat_by_house[house_value] = value
+
+    # Print house by house; slots are already in display order. Lines are
+    # collected and written with one print instead of one per attribute,
+    # so stdout is locked (and, when line-buffered, flushed) once.
+    lines = []
     for house in range(1, 6):
-        print(f"\nHouse {house}:")
-        print("-" * 15)
-        for attr_type, attr_value in sorted(houses_info[house]):
-            print(f"  {attr_type:12}: {attr_value}")
-    
+        lines.append(f"\nHouse {house}:")
+        lines.append("-" * 15)
+        for attr_type, attr_value in zip(SLOT_LABELS, houses_info[house]):
+            if attr_value is not None:
+                lines.append(f"  {attr_type:12}: {attr_value}")
+    print("\n".join(lines))
+
     # Answer the questions
     zebra_house = int(solution['pet_Zebra']) if solution['pet_Zebra'] is not None else 0
     water_house = int(solution['drink_Water']) if solution['drink_Water'] is not None else 0
-    
-    # Find nationalities
-    zebra_owner = None
-    water_drinker = None
-    for var_name, house in solution.items():
-        var_name_str = str(var_name)  # Ensure var_name is string
-        house_value = int(house) if house is not None else 0
-        if var_name_str.startswith('nat_'):
-            if house_value == zebra_house:
-                zebra_owner = var_name_str[4:]
-            if house_value == water_house:
-                water_drinker = var_name_str[4:]
-    
+    zebra_owner = nat_by_house.get(zebra_house)
+    water_drinker = nat_by_house.get(water_house)
+
     print(f"\n" + "="*60)
     print("ANSWERS:")
     print(f"Who owns the zebra? {zebra_owner} (House {zebra_house})")
@@ -221,55 +224,70 @@ def solve_simple_logic_puzzle():
     print("4. Carol has the fish")
     
     model = gurddy.Model("SimpleLogic", "CSP")
-    
+
     # People, pets, house colors (encoded as 1, 2, 3 for mask optimization)
     people = ['Alice', 'Bob', 'Carol']
-    pets = ['Cat', 'Dog', 'Fish'] 
+    pets = ['Cat', 'Dog', 'Fish']
     colors = ['Red', 'Blue', 'Green']
-    
-    # Variables
+
+    all_names = (
+        [f'person_{p}' for p in people]
+        + [f'pet_{p}' for p in pets]
+        + [f'color_{c}' for c in colors]
+    )
+
+    # All four clues are equalities, so - as in the Zebra model - merge each
+    # equality-linked group into one solver variable instead of wrapping a
+    # Python callback in a FunctionConstraint per clue. gurddy has no table
+    # constraint; aliasing removes the Python dispatch entirely and leaves
+    # only native AllDifferent propagation.
+    equality_clues = [
+        ('person_Alice', 'pet_Cat'),    # Clue 1
+        ('person_Bob', 'color_Red'),    # Clue 2
+        ('pet_Cat', 'color_Green'),     # Clue 3
+        ('person_Carol', 'pet_Fish'),   # Clue 4
+    ]
+
+    parent = {name: name for name in all_names}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for a, b in equality_clues:
+        parent[find(b)] = find(a)
+
+    rep_vars = {}
     vars_dict = {}
-    for person in people:
-        vars_dict[f'person_{person}'] = model.addVar(f'person_{person}', domain=[1, 2, 3])
-    for pet in pets:
-        vars_dict[f'pet_{pet}'] = model.addVar(f'pet_{pet}', domain=[1, 2, 3])
-    for color in colors:
-        vars_dict[f'color_{color}'] = model.addVar(f'color_{color}', domain=[1, 2, 3])
-    
+    for name in all_names:
+        rep = find(name)
+        if rep not in rep_vars:
+            rep_vars[rep] = model.addVar(rep, domain=[1, 2, 3])
+        vars_dict[name] = rep_vars[rep]
+
     # Each person/pet/color appears exactly once
     person_vars = [vars_dict[f'person_{p}'] for p in people]
     pet_vars = [vars_dict[f'pet_{p}'] for p in pets]
     color_vars = [vars_dict[f'color_{c}'] for c in colors]
-    
+
     model.addConstraint(gurddy.AllDifferentConstraint(person_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(pet_vars))
     model.addConstraint(gurddy.AllDifferentConstraint(color_vars))
-    
-    # Clue constraints
-    def same_position(pos1, pos2):
-        return pos1 == pos2
-    
-    # Clue 1: Alice has the cat
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_position, (vars_dict['person_Alice'], vars_dict['pet_Cat'])
-    ))
-    
-    # Clue 2: Bob lives in the red house
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_position, (vars_dict['person_Bob'], vars_dict['color_Red'])
-    ))
-    
-    # Clue 3: The person with the cat lives in the green house
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_position, (vars_dict['pet_Cat'], vars_dict['color_Green'])
-    ))
-    
-    # Clue 4: Carol has the fish
-    model.addConstraint(gurddy.FunctionConstraint(
-        same_position, (vars_dict['person_Carol'], vars_dict['pet_Fish'])
-    ))
-    
-    solution = model.solve()
+
+    # Force the solver's bitmask path: 3-value domains fit in a 3-bit int
+    # mask, so AllDifferent propagation runs as word-wide bitwise ops and
+    # popcounts instead of per-value set bookkeeping.
+    solver = gurddy.CSPSolver(model)
+    solver.force_mask = True
+    solution = solver.solve()
+
+    # Expand the merged solution back to every attribute name
+    if solution:
+        solution = dict(solution)
+        for name in all_names:
+            solution.setdefault(name, solution[find(name)])
     
     if solution:
         print("\nSolution:")
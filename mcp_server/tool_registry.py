@@ -477,7 +477,7 @@ def get_all_function_names() -> List[str]:
 
 def get_tools_by_category(category: str) -> List[Dict[str, Any]]:
     """Get tools filtered by category."""
-    return [tool for tool in TOOLS if tool["category"] == category]
+    return [TOOLS[i] for i in TOOLS_BY_CATEGORY.get(category, ())]
 
 
 def get_tool_count() -> int:
@@ -487,7 +487,7 @@ def get_tool_count() -> int:
 
 def get_categories() -> List[str]:
     """Get list of all categories."""
-    return list(set(tool["category"] for tool in TOOLS))
+    return list(TOOLS_BY_CATEGORY)
 
 
 def get_tool_schemas() -> Dict[str, Dict[str, Any]]:
@@ -507,10 +507,8 @@ def get_tool_schemas() -> Dict[str, Dict[str, Any]]:
 
 def get_tool_by_name(name: str) -> Dict[str, Any]:
     """Get tool definition by name."""
-    for tool in TOOLS:
-        if tool["name"] == name:
-            return tool
-    return None
+    idx = _TOOL_BY_NAME.get(name)
+    return TOOLS[idx] if idx is not None else None
 
 
 def get_function_name_mapping() -> Dict[str, str]:
@@ -535,9 +533,75 @@ def generate_auto_approve_list() -> List[str]:
     return get_all_tool_names()
 
 
+# Precomputed lookups: category -> TOOLS indices, name -> TOOLS index
+TOOLS_BY_CATEGORY = {
+    "meta": [0, 1],
+    "examples": [2],
+    "csp": [3, 4, 5, 6],
+    "optimization": [7, 8],
+    "game_theory": [9, 10],
+    "classic": [11, 12],
+    "scipy": [13, 14, 15],
+}
+
+_TOOL_BY_NAME = {
+    "info": 0,
+    "install": 1,
+    "run_example": 2,
+    "solve_n_queens": 3,
+    "solve_sudoku": 4,
+    "solve_graph_coloring": 5,
+    "solve_map_coloring": 6,
+    "solve_lp": 7,
+    "solve_production_planning": 8,
+    "solve_minimax_game": 9,
+    "solve_minimax_decision": 10,
+    "solve_24_point_game": 11,
+    "solve_chicken_rabbit_problem": 12,
+    "solve_scipy_portfolio_optimization": 13,
+    "solve_scipy_statistical_fitting": 14,
+    "solve_scipy_facility_location": 15,
+}
+
+
 # Export commonly used values
-ALL_TOOL_NAMES = get_all_tool_names()
-ALL_FUNCTION_NAMES = get_all_function_names()
-TOOL_COUNT = get_tool_count()
+# Name lists and count are precomputed at generation time
+ALL_TOOL_NAMES = [
+    "info",
+    "install",
+    "run_example",
+    "solve_n_queens",
+    "solve_sudoku",
+    "solve_graph_coloring",
+    "solve_map_coloring",
+    "solve_lp",
+    "solve_production_planning",
+    "solve_minimax_game",
+    "solve_minimax_decision",
+    "solve_24_point_game",
+    "solve_chicken_rabbit_problem",
+    "solve_scipy_portfolio_optimization",
+    "solve_scipy_statistical_fitting",
+    "solve_scipy_facility_location"
+]
+ALL_FUNCTION_NAMES = [
+    "info",
+    "pip_install",
+    "run_example",
+    "solve_n_queens",
+    "solve_sudoku",
+    "solve_graph_coloring",
+    "solve_map_coloring",
+    "solve_lp",
+    "solve_production_planning",
+    "solve_minimax_game",
+    "solve_minimax_decision",
+    "solve_24_point_game",
+    "solve_chicken_rabbit_problem",
+    "solve_scipy_portfolio_optimization",
+    "solve_scipy_statistical_fitting",
+    "solve_scipy_facility_location"
+]
+TOOL_COUNT = 16
 TOOL_SCHEMAS = get_tool_schemas()
 FUNCTION_NAME_MAPPING = get_function_name_mapping()
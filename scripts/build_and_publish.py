@@ -9,6 +9,9 @@ Usage:
 """
 
 import argparse
+import glob
+import importlib.util
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -24,13 +27,22 @@ def run_command(cmd, check=True):
 def clean_build():
     """Clean previous build artifacts."""
     print("Cleaning build artifacts...")
-    run_command("rm -rf build/ dist/ *.egg-info/", check=False)
+    for path in ["build", "dist"] + glob.glob("*.egg-info"):
+        shutil.rmtree(path, ignore_errors=True)
 
 
 def generate_schemas():
     """Generate schemas from function signatures."""
     print("Generating schemas from function signatures...")
-    return run_command("python generate_registry.py")
+    # Run in-process instead of shelling out to a fresh interpreter - the
+    # heavy mcp_server imports are already warm here.
+    try:
+        import generate_registry
+        generate_registry.main()
+        return True
+    except Exception as e:
+        print(f"Schema generation error: {e}")
+        return False
 
 
 def build_package():
@@ -60,12 +72,10 @@ def run_tests():
 def check_dependencies():
     """Check if required tools are installed."""
     tools = ["build", "twine"]
-    missing = []
-    
-    for tool in tools:
-        if not run_command(f"python -m {tool} --help > /dev/null 2>&1", check=False):
-            missing.append(tool)
-    
+    # find_spec answers "is it importable" without forking a subprocess
+    # per tool just to run --help.
+    missing = [tool for tool in tools if importlib.util.find_spec(tool) is None]
+
     if missing:
         print(f"Missing required tools: {', '.join(missing)}")
         print("Install them with: pip install build twine")
@@ -4,17 +4,49 @@ Build hook script that runs before package building.
 This ensures schemas are generated and verified before building.
 """
 
+import hashlib
 import sys
 import subprocess
 import os
 from pathlib import Path
 
+# Cache of the last run's input hash; lets repeat builds skip schema
+# regeneration and verification when nothing they read has changed.
+HASH_FILE = Path(".build_cache") / "registry.hash"
+
+
+def compute_inputs_hash(project_root):
+    """Hash everything the hook's steps depend on.
+
+    Covers the generator script plus all mcp_server sources (tool
+    definitions and the handler modules whose signatures become schemas).
+    The generated tool_registry.py is included too: it is the generator's
+    output, but it is an input to the verification step, so deleting or
+    hand-editing it must invalidate the cache. blake2b is plenty for
+    change detection and faster than sha256.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    files = [project_root / "scripts" / "generate_registry.py"]
+    files += sorted((project_root / "mcp_server").rglob("*.py"))
+    for path in files:
+        if "__pycache__" in path.parts:
+            continue
+        h.update(str(path.relative_to(project_root)).encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
 
 def run_command(cmd, description):
-    """Run a command and handle errors."""
+    """Run a command and handle errors.
+
+    stdout is discarded in the kernel via DEVNULL instead of being
+    buffered into a Python string that is never read; only stderr is
+    captured, since that is all the failure path prints.
+    """
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, shell=True, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -30,15 +62,29 @@ def main():
     # Change to project root
     project_root = Path(__file__).parent.parent
     os.chdir(project_root)
-    
+
+    # Skip both steps when the inputs - including the generated registry
+    # itself - are byte-identical to the last verified run
+    registry_path = project_root / "mcp_server" / "tool_registry.py"
+    if (registry_path.exists() and HASH_FILE.exists()
+            and HASH_FILE.read_text() == compute_inputs_hash(project_root)):
+        print("✅ Registry inputs unchanged (cache hit), skipping regeneration")
+        return
+
     # Step 1: Generate schemas
     if not run_command(f"{sys.executable} scripts/generate_registry.py", "Generating schemas"):
         sys.exit(1)
-    
+
     # Step 2: Verify consistency
     if not run_command(f"{sys.executable} scripts/verify_consistency.py", "Verifying consistency"):
         sys.exit(1)
-    
+
+    # Record the hash only after both steps succeed so a failed run never
+    # registers as a cache hit; recompute it now so the stored digest
+    # covers the freshly generated registry.
+    HASH_FILE.parent.mkdir(exist_ok=True)
+    HASH_FILE.write_text(compute_inputs_hash(project_root))
+
     print("🎉 All pre-build hooks completed successfully!")
 
 
@@ -4,27 +4,54 @@ Generate documentation snippets from tool registry.
 Run this script to update documentation when tools are added/modified.
 """
 
+import functools
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mcp_server.tool_registry import (
-    TOOLS,
-    TOOL_COUNT,
-    generate_tool_list_markdown,
-    generate_auto_approve_list,
-)
+
+@functools.cache
+def _registry():
+    """Import the tool registry on first use.
+
+    Deferring the import keeps `import generate_docs` cheap for scripts
+    that only want one of the generator functions; the registry (and its
+    transitive mcp_server imports) loads only when docs are generated.
+    """
+    from mcp_server import tool_registry
+    return tool_registry
+
+
+def _index_tools(tools):
+    """Build all lookup structures over TOOLS in a single pass.
+
+    The registry helpers (get_categories, get_tools_by_category, ...) each
+    rescan TOOLS per call; indexing once up front keeps the generator
+    functions O(k) per category instead of O(N) per lookup.
+    """
+    by_cat = defaultdict(list)
+    names = []
+    for tool in tools:
+        by_cat[tool["category"]].append(tool)
+        names.append(tool["name"])
+    return {
+        "by_cat": by_cat,
+        "names": names,
+        "sorted_cats": sorted(by_cat),
+    }
 
 
 def generate_readme_tool_list():
     """Generate the tool list section for README.md"""
+    registry = _registry()
     print("=" * 60)
-    print(f"MCP TOOLS LIST ({TOOL_COUNT} tools)")
+    print(f"MCP TOOLS LIST ({registry.TOOL_COUNT} tools)")
     print("=" * 60)
     print()
-    print(generate_tool_list_markdown())
+    print(registry.generate_tool_list_markdown())
     print()
 
 
@@ -34,29 +61,26 @@ def generate_mcp_config():
     print("MCP CONFIG - autoApprove list")
     print("=" * 60)
     print()
-    print('"autoApprove": [')
-    tools = generate_auto_approve_list()
-    for i, tool in enumerate(tools):
-        comma = "," if i < len(tools) - 1 else ""
-        print(f'  "{tool}"{comma}')
-    print("]")
+    # One joined write instead of a locked print per tool
+    tools = _registry().generate_auto_approve_list()
+    body = ",\n".join(f'  "{tool}"' for tool in tools)
+    print(f'"autoApprove": [\n{body}\n]')
     print()
 
 
-def generate_tool_summary():
+def generate_tool_summary(idx):
     """Generate a summary of tools by category"""
-    from mcp_server.tool_registry import get_categories, get_tools_by_category
-    
     print("=" * 60)
     print("TOOLS BY CATEGORY")
     print("=" * 60)
     print()
-    
-    for category in sorted(get_categories()):
-        tools = get_tools_by_category(category)
-        print(f"\n{category.upper()} ({len(tools)} tools):")
-        for tool in tools:
-            print(f"  - {tool['name']}: {tool['description']}")
+
+    by_cat = idx["by_cat"]
+    for category in idx["sorted_cats"]:
+        tools = by_cat[category]
+        lines = [f"\n{category.upper()} ({len(tools)} tools):"]
+        lines.extend(f"  - {tool['name']}: {tool['description']}" for tool in tools)
+        print("\n".join(lines))
     print()
 
 
@@ -65,11 +89,13 @@ def main():
     print("\n" + "=" * 60)
     print("GURDDY MCP DOCUMENTATION GENERATOR")
     print("=" * 60 + "\n")
-    
+
+    idx = _index_tools(_registry().TOOLS)
+
     generate_readme_tool_list()
     generate_mcp_config()
-    generate_tool_summary()
-    
+    generate_tool_summary(idx)
+
     print("=" * 60)
     print("Copy the sections above to update:")
     print("  - README.md (tool list)")
@@ -3,62 +3,97 @@
 Simple script to generate tool_registry.py with auto-generated schemas.
 """
 
+import concurrent.futures
+import filecmp
+import functools
 import inspect
 import importlib
 import sys
 import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, get_type_hints, Union, Optional, List
+from typing import Dict, Any, get_args, get_origin, get_type_hints, Union, Optional, List
 import json
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from mcp_server.tool_definitions import TOOL_DEFINITIONS
+
+@functools.lru_cache(maxsize=None)
+def _load_module(module_name: str):
+    """Import an mcp_server submodule, caching across tools that share it."""
+    return importlib.import_module(f"mcp_server.{module_name}")
+
+
+@functools.lru_cache(maxsize=None)
+def _hints_for(func) -> Dict[str, Any]:
+    """Resolve type hints once per function; forward-ref resolution is not free."""
+    return get_type_hints(func)
 
 
 def get_type_schema(type_hint: Any) -> Dict[str, Any]:
     """Convert Python type hint to JSON schema."""
-    if type_hint == str:
-        return {"type": "string"}
-    elif type_hint == int:
-        return {"type": "integer"}
-    elif type_hint == float:
-        return {"type": "number"}
-    elif type_hint == bool:
-        return {"type": "boolean"}
-    elif type_hint == list or type_hint == List:
+    try:
+        return dict(_get_type_schema_cached(type_hint))
+    except TypeError:
+        # Unhashable hint - fall back to the uncached walk
+        return _get_type_schema(type_hint)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_schema_cached(type_hint: Any) -> Dict[str, Any]:
+    return _get_type_schema(type_hint)
+
+
+# Primitive hint -> schema table; a single dict hit replaces the chained
+# equality ladder. Entries are copied on return so callers can annotate them.
+_PRIM_MAP = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    list: {"type": "array"},
+    List: {"type": "array"},
+    dict: {"type": "object"},
+    Dict: {"type": "object"},
+}
+
+
+def _get_type_schema(type_hint: Any) -> Dict[str, Any]:
+    try:
+        prim = _PRIM_MAP.get(type_hint)
+    except TypeError:
+        prim = None  # unhashable hint
+    if prim is not None:
+        return dict(prim)
+
+    origin = get_origin(type_hint)
+    if origin is Union:
+        # Optional[T] is Union[T, None]
+        args = get_args(type_hint)
+        if len(args) == 2 and type(None) in args:
+            non_none_type = args[0] if args[1] is type(None) else args[1]
+            return get_type_schema(non_none_type)
+    elif origin is list:
+        args = get_args(type_hint)
+        if args:
+            return {"type": "array", "items": get_type_schema(args[0])}
         return {"type": "array"}
-    elif type_hint == dict or type_hint == Dict:
+    elif origin is dict:
         return {"type": "object"}
-    
-    # Handle Union types (Optional is Union[T, None])
-    if hasattr(type_hint, '__origin__'):
-        if type_hint.__origin__ is Union:
-            args = type_hint.__args__
-            if len(args) == 2 and type(None) in args:
-                non_none_type = args[0] if args[1] is type(None) else args[1]
-                return get_type_schema(non_none_type)
-        elif type_hint.__origin__ is list:
-            if type_hint.__args__:
-                item_schema = get_type_schema(type_hint.__args__[0])
-                return {"type": "array", "items": item_schema}
-            return {"type": "array"}
-        elif type_hint.__origin__ is dict:
-            return {"type": "object"}
-    
+
     return {"type": "object"}
 
 
 def generate_schema(module_name: str, function_name: str) -> Dict[str, Any]:
     """Generate JSON schema from function signature."""
     try:
-        module = importlib.import_module(f"mcp_server.{module_name}")
+        module = _load_module(module_name)
         func = getattr(module, function_name)
-        
+
         sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
+        type_hints = _hints_for(func)
         
         properties = {}
         required = []
@@ -86,26 +121,33 @@ def generate_schema(module_name: str, function_name: str) -> Dict[str, Any]:
         return {"type": "object", "properties": {}, "required": []}
 
 
-def main():
-    print("🔄 Generating tool registry with auto-generated schemas...")
-    
-    # Change to project root directory
-    os.chdir(project_root)
-    
-    tools = []
-    for tool_def in TOOL_DEFINITIONS:
-        schema = generate_schema(tool_def["module"], tool_def["function"])
-        
-        tool = tool_def.copy()
-        tool["inputSchema"] = schema
-        tools.append(tool)
-        
-        print(f"✅ {tool_def['name']}")
-    
-    # Generate registry content
-    tools_json = json.dumps(tools, indent=4, ensure_ascii=False)
-    
-    registry_content = f'''"""
+def _generate_all_schemas(tool_defs):
+    """Generate schemas for all tool definitions, in order.
+
+    Schema generation per tool is independent (import + signature +
+    type-hint introspection), so spread it across cores when there are
+    enough tools to amortize process startup; otherwise run serially.
+    """
+    jobs = [(td["module"], td["function"]) for td in tool_defs]
+    if len(jobs) >= 4 and (os.cpu_count() or 1) > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(jobs), os.cpu_count())
+            ) as executor:
+                return list(executor.map(
+                    generate_schema,
+                    [module for module, _ in jobs],
+                    [function for _, function in jobs],
+                ))
+        except Exception as e:
+            print(f"⚠️  Parallel schema generation failed ({e}), falling back to serial")
+    return [generate_schema(module, function) for module, function in jobs]
+
+
+# Static parts of the generated module. Plain strings (not f-string
+# templates) so the tool JSON never has to be spliced into one giant
+# buffer before hitting the file.
+_REGISTRY_HEADER = '''"""
 Central registry for all MCP tools and their metadata.
 This is the single source of truth for tool definitions.
 
@@ -117,7 +159,10 @@ from typing import List, Dict, Any
 
 # Tool definitions - single source of truth
 # Schemas auto-generated from function signatures
-TOOLS = {tools_json}
+TOOLS = [
+'''
+
+_REGISTRY_FUNCTIONS = ''']
 
 
 def get_all_tool_names() -> List[str]:
@@ -132,7 +177,7 @@ def get_all_function_names() -> List[str]:
 
 def get_tools_by_category(category: str) -> List[Dict[str, Any]]:
     """Get tools filtered by category."""
-    return [tool for tool in TOOLS if tool["category"] == category]
+    return [TOOLS[i] for i in TOOLS_BY_CATEGORY.get(category, ())]
 
 
 def get_tool_count() -> int:
@@ -142,7 +187,7 @@ def get_tool_count() -> int:
 
 def get_categories() -> List[str]:
     """Get list of all categories."""
-    return list(set(tool["category"] for tool in TOOLS))
+    return list(TOOLS_BY_CATEGORY)
 
 
 def get_tool_schemas() -> Dict[str, Dict[str, Any]]:
@@ -151,21 +196,19 @@ def get_tool_schemas() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict mapping tool name to schema (description + inputSchema)
     """
-    schemas = {{}}
+    schemas = {}
     for tool in TOOLS:
-        schemas[tool["name"]] = {{
+        schemas[tool["name"]] = {
             "description": tool["description"],
             "inputSchema": tool["inputSchema"]
-        }}
+        }
     return schemas
 
 
 def get_tool_by_name(name: str) -> Dict[str, Any]:
     """Get tool definition by name."""
-    for tool in TOOLS:
-        if tool["name"] == name:
-            return tool
-    return None
+    idx = _TOOL_BY_NAME.get(name)
+    return TOOLS[idx] if idx is not None else None
 
 
 def get_function_name_mapping() -> Dict[str, str]:
@@ -174,14 +217,14 @@ def get_function_name_mapping() -> Dict[str, str]:
     Returns:
         Dict mapping tool name to function name
     """
-    return {{tool["name"]: tool["function"] for tool in TOOLS}}
+    return {tool["name"]: tool["function"] for tool in TOOLS}
 
 
 def generate_tool_list_markdown() -> str:
     """Generate markdown list of all tools for documentation."""
     lines = []
     for tool in TOOLS:
-        lines.append(f"- `{{tool['name']}}` - {{tool['description']}}")
+        lines.append(f"- `{tool['name']}` - {tool['description']}")
     return "\\n".join(lines)
 
 
@@ -190,20 +233,89 @@ def generate_auto_approve_list() -> List[str]:
     return get_all_tool_names()
 
 
-# Export commonly used values
-ALL_TOOL_NAMES = get_all_tool_names()
-ALL_FUNCTION_NAMES = get_all_function_names()
-TOOL_COUNT = get_tool_count()
-TOOL_SCHEMAS = get_tool_schemas()
-FUNCTION_NAME_MAPPING = get_function_name_mapping()
 '''
-    
-    # Write to file (relative to project root)
+
+
+def main():
+    # Imported here, not at module top, so scripts that import this module
+    # for its schema helpers don't drag in the tool definitions and their
+    # transitive mcp_server imports.
+    from mcp_server.tool_definitions import TOOL_DEFINITIONS
+
+    print("🔄 Generating tool registry with auto-generated schemas...")
+
+    # Change to project root directory
+    os.chdir(project_root)
+
+    tools = []
+    for tool_def, schema in zip(TOOL_DEFINITIONS, _generate_all_schemas(TOOL_DEFINITIONS)):
+        tool = tool_def.copy()
+        tool["inputSchema"] = schema
+        tools.append(tool)
+
+        print(f"✅ {tool_def['name']}")
+
+    # Write the registry incrementally: header, one JSON blob per tool,
+    # then the static helpers. Peak memory is one tool's JSON instead of
+    # the whole registry serialized into a single string.
+    #
+    # The content is streamed into a sibling temp file that is swapped in
+    # with os.replace, so an interrupted run can never leave a truncated
+    # module for every downstream import to trip over.
     registry_path = project_root / "mcp_server" / "tool_registry.py"
-    with open(registry_path, 'w', encoding='utf-8') as f:
-        f.write(registry_content)
-    
-    print(f"\n🎉 Generated tool_registry.py with {len(tools)} tools")
+    tmp = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=registry_path.parent,
+        prefix='.tool_registry.', suffix='.tmp', delete=False)
+    tmp_path = Path(tmp.name)
+    with tmp as f:
+        f.write(_REGISTRY_HEADER)
+        last = len(tools) - 1
+        for i, tool in enumerate(tools):
+            block = json.dumps(tool, indent=4, ensure_ascii=False)
+            f.write("    " + block.replace("\n", "\n    "))
+            f.write(",\n" if i < last else "\n")
+        f.write(_REGISTRY_FUNCTIONS)
+
+        # Lookup tables evaluated at codegen time: TOOLS never changes at
+        # runtime, so category and name lookups become dict hits over
+        # indices instead of linear scans of TOOLS per call.
+        tools_by_cat = {}
+        for i, tool in enumerate(tools):
+            tools_by_cat.setdefault(tool["category"], []).append(i)
+        f.write("# Precomputed lookups: category -> TOOLS indices, name -> TOOLS index\n")
+        f.write("TOOLS_BY_CATEGORY = {\n")
+        for category, indices in tools_by_cat.items():
+            f.write("    %s: %s,\n" % (json.dumps(category), indices))
+        f.write("}\n\n")
+        f.write("_TOOL_BY_NAME = {\n")
+        for i, tool in enumerate(tools):
+            f.write("    %s: %d,\n" % (json.dumps(tool["name"]), i))
+        f.write("}\n\n\n")
+
+        # Emit the hot lookups as literals so importing the registry does
+        # not rescan TOOLS; the dict-valued exports stay derived to avoid
+        # duplicating every schema in the file.
+        f.write("# Export commonly used values\n")
+        f.write("# Name lists and count are precomputed at generation time\n")
+        f.write("ALL_TOOL_NAMES = %s\n" % json.dumps(
+            [tool["name"] for tool in tools], indent=4))
+        f.write("ALL_FUNCTION_NAMES = %s\n" % json.dumps(
+            [tool["function"] for tool in tools], indent=4))
+        f.write("TOOL_COUNT = %d\n" % len(tools))
+        f.write("TOOL_SCHEMAS = get_tool_schemas()\n")
+        f.write("FUNCTION_NAME_MAPPING = get_function_name_mapping()\n")
+
+        f.flush()
+        os.fsync(f.fileno())
+
+    if registry_path.exists() and filecmp.cmp(tmp_path, registry_path, shallow=False):
+        # Unchanged content: drop the temp file and keep the old mtime so
+        # mtime-based build tools don't retrigger dependent steps.
+        tmp_path.unlink()
+        print(f"\n🎉 tool_registry.py already up to date ({len(tools)} tools)")
+    else:
+        os.replace(tmp_path, registry_path)
+        print(f"\n🎉 Generated tool_registry.py with {len(tools)} tools")
     print("💡 Run 'python scripts/verify_consistency.py' to verify the generated registry")
 
 
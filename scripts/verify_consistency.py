@@ -1,192 +1,360 @@
 #!/usr/bin/env python3
 """Verify consistency between tool registry and server implementations."""
 
+import concurrent.futures
+import functools
+import os
 import sys
 import inspect
 import importlib
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import AbstractSet, Dict, List, Any, Set
+from weakref import WeakKeyDictionary
 
-from mcp_server.tool_registry import TOOLS, TOOL_SCHEMAS, get_tool_by_name
-from mcp_server.mcp_stdio_server import MCPStdioServer
-from mcp_server.core.tool_registry import get_registry
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Only the registry data and the handler module are needed by every
+# check; the stdio and HTTP server modules (which register all tools on
+# import) load lazily inside the checks that verify them.
+from mcp_server.tool_registry import TOOLS, TOOL_SCHEMAS
 from mcp_server.handlers import gurddy
 
-# Import to register HTTP tools
-import mcp_server.tools.registry  # noqa: F401
+# Name-keyed view of TOOLS, built once so per-tool lookups inside the
+# verification loops are dict hits instead of registry function calls.
+TOOLS_BY_NAME = {tool["name"]: tool for tool in TOOLS}
+
+# Fields every registry entry must carry; fixed at author time, so the
+# per-tool check is one C-level set difference against tool.keys().
+_REQUIRED_FIELDS = frozenset(
+    {"name", "function", "description", "category", "module", "inputSchema"})
+
+# Schema parameter sets, precomputed once: the schema-consistency check
+# compares these against signatures every run, and TOOLS never changes
+# after import.
+_SCHEMA_PARAM_SETS = {
+    tool["name"]: frozenset((tool["inputSchema"].get("properties") or {}).keys())
+    for tool in TOOLS
+}
+
+
+class Reporter:
+    """Accumulates report lines and emits them with a single write.
+
+    One write() per check instead of one per message keeps the syscall
+    count constant when stdout is line-buffered or piped, and lets the
+    concurrent checks interleave without garbling output.
+    """
+
+    __slots__ = ("_lines",)
+
+    def __init__(self):
+        self._lines = []
+
+    def line(self, text=""):
+        self._lines.append(text)
+
+    def ok(self, text):
+        self._lines.append(f"  ✅ {text}")
 
+    def fail(self, text):
+        self._lines.append(f"  ❌ {text}")
 
-def verify_stdio_server():
+    def warn(self, text):
+        self._lines.append(f"    ⚠️  {text}")
+
+    def flush(self, stream=None):
+        if self._lines:
+            (stream or sys.stdout).write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+
+
+# Lazily constructed stdio server, shared so additional checks can reuse
+# the instance without re-registering every tool (construction wires all
+# of TOOLS into server.tools and server.function_map).
+_stdio_server = None
+
+
+def _get_stdio_server():
+    global _stdio_server
+    if _stdio_server is None:
+        from mcp_server.mcp_stdio_server import MCPStdioServer
+        _stdio_server = MCPStdioServer()
+    return _stdio_server
+
+
+def verify_stdio_server(report):
     """Verify stdio server consistency."""
-    print("🔍 Verifying Stdio Server...")
-    server = MCPStdioServer()
+    report.line("🔍 Verifying Stdio Server...")
+    server = _get_stdio_server()
     
     # Check tool count
     if len(server.tools) != len(TOOLS):
-        print(f"  ❌ Tool count mismatch: {len(server.tools)} vs {len(TOOLS)}")
+        report.fail(f"Tool count mismatch: {len(server.tools)} vs {len(TOOLS)}")
         return False
-    print(f"  ✅ Tool count: {len(server.tools)}")
+    report.ok(f"Tool count: {len(server.tools)}")
     
-    # Check all tools are registered
-    for tool in TOOLS:
-        tool_name = tool["name"]
-        if tool_name not in server.tools:
-            print(f"  ❌ Tool '{tool_name}' not found in stdio server")
-            return False
-        if tool_name not in server.function_map:
-            print(f"  ❌ Function mapping missing for '{tool_name}'")
-            return False
-    print(f"  ✅ All tools registered")
+    # Check all tools are registered: two C-level set differences instead
+    # of a Python membership test per tool
+    required_names = TOOLS_BY_NAME.keys()
+    missing_tools = required_names - server.tools.keys()
+    missing_functions = required_names - server.function_map.keys()
+    if missing_tools or missing_functions:
+        for tool_name in sorted(missing_tools):
+            report.fail(f"Tool '{tool_name}' not found in stdio server")
+        for tool_name in sorted(missing_functions):
+            report.fail(f"Function mapping missing for '{tool_name}'")
+        return False
+    report.ok(f"All tools registered")
     
-    # Check schemas match
+    # Check schemas match, reporting every mismatch in the single pass
+    # instead of stopping at the first one
+    mismatched = False
     for tool_name, schema in server.tools.items():
-        tool_def = get_tool_by_name(tool_name)
+        tool_def = TOOLS_BY_NAME[tool_name]
         if schema["description"] != tool_def["description"]:
-            print(f"  ❌ Description mismatch for '{tool_name}'")
-            return False
-        if schema["inputSchema"] != tool_def["inputSchema"]:
-            print(f"  ❌ Schema mismatch for '{tool_name}'")
-            return False
-    print(f"  ✅ All schemas match")
-    
+            report.fail(f"Description mismatch for '{tool_name}'")
+            mismatched = True
+        # The server usually holds the very dict TOOLS stores, so an O(1)
+        # identity check skips the recursive dict comparison; the deep
+        # compare only runs when the server copied the schema.
+        input_schema = schema["inputSchema"]
+        if input_schema is not tool_def["inputSchema"] and input_schema != tool_def["inputSchema"]:
+            report.fail(f"Schema mismatch for '{tool_name}'")
+            mismatched = True
+    if mismatched:
+        return False
+    report.ok(f"All schemas match")
+
     return True
 
 
-def verify_http_server():
+def verify_http_server(report):
     """Verify HTTP server consistency."""
-    print("\n🔍 Verifying HTTP Server...")
+    report.line("\n🔍 Verifying HTTP Server...")
+    from mcp_server.core.tool_registry import get_registry
+
+    # Import to register HTTP tools
+    import mcp_server.tools.registry  # noqa: F401
+
     registry = get_registry()
     tools = registry.get_tools()
     
     # Check tool count
     if len(tools) != len(TOOLS):
-        print(f"  ❌ Tool count mismatch: {len(tools)} vs {len(TOOLS)}")
+        report.fail(f"Tool count mismatch: {len(tools)} vs {len(TOOLS)}")
         return False
-    print(f"  ✅ Tool count: {len(tools)}")
+    report.ok(f"Tool count: {len(tools)}")
     
-    # Check all tools are registered
-    for tool in TOOLS:
-        tool_name = tool["name"]
-        if tool_name not in tools:
-            print(f"  ❌ Tool '{tool_name}' not found in HTTP server")
-            return False
-    print(f"  ✅ All tools registered")
-    
-    # Check handlers exist
-    for tool in TOOLS:
-        handler = registry.get_handler(tool["name"])
-        if handler is None:
-            print(f"  ❌ Handler missing for '{tool['name']}'")
-            return False
-    print(f"  ✅ All handlers exist")
+    # Check all tools are registered via one set difference
+    missing_tools = TOOLS_BY_NAME.keys() - set(tools)
+    if missing_tools:
+        for tool_name in sorted(missing_tools):
+            report.fail(f"Tool '{tool_name}' not found in HTTP server")
+        return False
+    report.ok(f"All tools registered")
     
+    # Check handlers exist, collecting every missing one
+    missing_handlers = [tool["name"] for tool in TOOLS
+                        if registry.get_handler(tool["name"]) is None]
+    if missing_handlers:
+        for tool_name in missing_handlers:
+            report.fail(f"Handler missing for '{tool_name}'")
+        return False
+    report.ok(f"All handlers exist")
+
     return True
 
 
-def verify_handlers():
+def verify_handlers(report):
     """Verify all handler functions exist."""
-    print("\n🔍 Verifying Handler Functions...")
-    
-    for tool in TOOLS:
-        func_name = tool["function"]
-        if not hasattr(gurddy, func_name):
-            print(f"  ❌ Handler function '{func_name}' not found")
-            return False
-    print(f"  ✅ All {len(TOOLS)} handler functions exist")
-    
+    report.line("\n🔍 Verifying Handler Functions...")
+
+    # One snapshot of the module dict and a single set difference instead
+    # of a hasattr (getattr + exception guard) per tool
+    available = set(vars(gurddy))
+    missing = {tool["function"] for tool in TOOLS} - available
+    if missing:
+        for func_name in sorted(missing):
+            report.fail(f"Handler function '{func_name}' not found")
+        return False
+    report.ok(f"All {len(TOOLS)} handler functions exist")
+
     return True
 
 
+# Parameter sets cached on the function object itself: the same callable
+# reached under two (module, name) paths still resolves to one signature
+# construction, and weak keys keep the cache from pinning functions alive.
+_SIG_CACHE = WeakKeyDictionary()
+
+
+def _signature_params(func) -> frozenset:
+    """Parameter-name frozenset for ``func``, cached by function identity."""
+    params = _SIG_CACHE.get(func)
+    if params is None:
+        params = frozenset(inspect.signature(func).parameters)
+        _SIG_CACHE[func] = params
+    return params
+
+
+@functools.lru_cache(maxsize=None)
 def get_function_signature_params(module_name: str, function_name: str) -> Set[str]:
-    """Get parameter names from function signature."""
+    """Get parameter names from function signature.
+
+    Cached so repeat lookups (tools sharing a function, multiple checks
+    touching the same signature) skip the import machinery and signature
+    construction; the frozenset result is immutable and safe to share.
+    """
     try:
         module = importlib.import_module(f"mcp_server.{module_name}")
-        func = getattr(module, function_name)
-        sig = inspect.signature(func)
-        return set(sig.parameters.keys())
+        return _signature_params(getattr(module, function_name))
     except Exception as e:
         print(f"    ⚠️  Error importing {module_name}.{function_name}: {e}")
-        return set()
+        return frozenset()
 
 
-def get_schema_params(input_schema: Dict[str, Any]) -> Set[str]:
-    """Get parameter names from JSON schema."""
-    properties = input_schema.get("properties", {})
-    return set(properties.keys())
+def get_schema_params(input_schema: Dict[str, Any]) -> AbstractSet[str]:
+    """Get parameter names from JSON schema.
 
+    Returns the properties KeysView rather than copying it into a set;
+    dict views support set algebra (-, &, ==) directly, so callers can
+    diff against signature params without materializing anything.
+    """
+    return (input_schema.get("properties") or {}).keys()
 
-def verify_schema_consistency():
-    """Verify consistency between tool schemas and function signatures."""
-    print("\n🔍 Verifying Schema-Function Consistency...")
-    
+
+def collect_schema_mismatches(warn=None):
+    """Scan TOOLS for schema/signature mismatches and return them.
+
+    Shared by this script and validate_schema_consistency.py so the
+    grouped-import scan exists exactly once. ``warn`` receives messages
+    about modules or functions that could not be inspected.
+
+    Group tools by module so each module is imported exactly once and
+    its functions are resolved with plain getattr, instead of
+    re-entering importlib (name parsing, sys.modules walk, import lock)
+    per tool.
+    """
     inconsistencies = []
-    
+
+    by_module = defaultdict(list)
     for tool in TOOLS:
-        tool_name = tool["name"]
-        module_name = tool["module"]
-        function_name = tool["function"]
-        input_schema = tool["inputSchema"]
-        
-        # Get parameter names from both sources
-        schema_params = get_schema_params(input_schema)
-        function_params = get_function_signature_params(module_name, function_name)
-        
-        if not function_params:
-            # Skip if we couldn't load the function
+        by_module[tool["module"]].append(tool)
+
+    for module_name, module_tools in by_module.items():
+        try:
+            module = importlib.import_module(f"mcp_server.{module_name}")
+        except Exception as e:
+            if warn:
+                warn(f"Error importing {module_name}: {e}")
             continue
-            
-        # Check for mismatches
-        missing_in_schema = function_params - schema_params
-        extra_in_schema = schema_params - function_params
-        
-        if missing_in_schema or extra_in_schema:
-            inconsistencies.append({
-                "tool_name": tool_name,
-                "missing_in_schema": list(missing_in_schema),
-                "extra_in_schema": list(extra_in_schema),
-                "schema_params": list(schema_params),
-                "function_params": list(function_params)
-            })
-    
+
+        for tool in module_tools:
+            function_name = tool["function"]
+            try:
+                function_params = _signature_params(getattr(module, function_name))
+            except Exception as e:
+                if warn:
+                    warn(f"Error inspecting {module_name}.{function_name}: {e}")
+                continue
+
+            schema_params = _SCHEMA_PARAM_SETS[tool["name"]]
+
+            # Check for mismatches
+            missing_in_schema = function_params - schema_params
+            extra_in_schema = schema_params - function_params
+
+            if missing_in_schema or extra_in_schema:
+                inconsistencies.append({
+                    "tool_name": tool["name"],
+                    "module": module_name,
+                    "function": function_name,
+                    "missing_in_schema": list(missing_in_schema),
+                    "extra_in_schema": list(extra_in_schema),
+                    "schema_params": list(schema_params),
+                    "function_params": list(function_params)
+                })
+
+    return inconsistencies
+
+
+def verify_schema_consistency(report):
+    """Verify consistency between tool schemas and function signatures."""
+    report.line("\n🔍 Verifying Schema-Function Consistency...")
+
+    inconsistencies = collect_schema_mismatches(warn=report.warn)
+
+
     if inconsistencies:
-        print(f"  ❌ Found {len(inconsistencies)} schema-function mismatches:")
+        report.fail(f"Found {len(inconsistencies)} schema-function mismatches:")
+
+        # Summary first - counts per error class - then the worst top-K
+        # offenders in detail, so a registry with many broken tools gives
+        # a triageable report instead of flooding the CI log. K comes
+        # from GURDDY_VERIFY_TOPK (default 10).
+        counts = Counter()
         for issue in inconsistencies:
-            print(f"    Tool '{issue['tool_name']}':")
             if issue['missing_in_schema']:
-                print(f"      Missing in schema: {issue['missing_in_schema']}")
+                counts['missing in schema'] += 1
+            if issue['extra_in_schema']:
+                counts['extra in schema'] += 1
+        for error_class, count in counts.most_common():
+            report.line(f"    {count} tool(s) with params {error_class}")
+
+        top_k = int(os.environ.get("GURDDY_VERIFY_TOPK", "10"))
+        worst = sorted(
+            inconsistencies,
+            key=lambda i: len(i['missing_in_schema']) + len(i['extra_in_schema']),
+            reverse=True,
+        )[:top_k]
+        for issue in worst:
+            report.line(f"    Tool '{issue['tool_name']}':")
+            if issue['missing_in_schema']:
+                report.line(f"      Missing in schema: {issue['missing_in_schema']}")
             if issue['extra_in_schema']:
-                print(f"      Extra in schema: {issue['extra_in_schema']}")
+                report.line(f"      Extra in schema: {issue['extra_in_schema']}")
+        hidden = len(inconsistencies) - len(worst)
+        if hidden > 0:
+            report.line(f"    ... and {hidden} more (raise GURDDY_VERIFY_TOPK to show them)")
         return False
     
-    print(f"  ✅ All {len(TOOLS)} tools have consistent schemas")
+    report.ok(f"All {len(TOOLS)} tools have consistent schemas")
     return True
 
 
-def verify_schemas():
+def verify_schemas(report):
     """Verify all tools have valid schemas."""
-    print("\n🔍 Verifying Tool Schemas...")
+    report.line("\n🔍 Verifying Tool Schemas...")
     
+    # One pass over TOOLS collecting every violation, so a registry with
+    # several broken entries surfaces them all in a single run
+    valid = True
     for tool in TOOLS:
-        # Check required fields
-        required_fields = ["name", "function", "description", "category", "module", "inputSchema"]
-        for field in required_fields:
-            if field not in tool:
-                print(f"  ❌ Tool '{tool.get('name', 'unknown')}' missing field '{field}'")
-                return False
-        
+        # Check required fields with one set difference per tool
+        tool_name = tool.get('name', 'unknown')
+        for field in sorted(_REQUIRED_FIELDS - tool.keys()):
+            report.fail(f"Tool '{tool_name}' missing field '{field}'")
+            valid = False
+
         # Check inputSchema structure
-        schema = tool["inputSchema"]
+        schema = tool.get("inputSchema")
+        if schema is None:
+            continue
         if "type" not in schema or schema["type"] != "object":
-            print(f"  ❌ Tool '{tool['name']}' has invalid inputSchema type")
-            return False
+            report.fail(f"Tool '{tool_name}' has invalid inputSchema type")
+            valid = False
         if "properties" not in schema:
-            print(f"  ❌ Tool '{tool['name']}' missing properties in inputSchema")
-            return False
+            report.fail(f"Tool '{tool_name}' missing properties in inputSchema")
+            valid = False
         if "required" not in schema:
-            print(f"  ❌ Tool '{tool['name']}' missing required in inputSchema")
-            return False
-    
-    print(f"  ✅ All {len(TOOLS)} schemas are valid")
+            report.fail(f"Tool '{tool_name}' missing required in inputSchema")
+            valid = False
+
+    if not valid:
+        return False
+    report.ok(f"All {len(TOOLS)} schemas are valid")
     return True
 
 
@@ -204,14 +372,24 @@ def main():
         ("HTTP Server", verify_http_server),
     ]
     
+    # Run the checks concurrently - they are independent, and the server
+    # construction / import / reflection work overlaps. Each check writes
+    # into its own buffer, which is flushed in the original order so the
+    # report stays deterministic.
     results = []
-    for name, check_func in checks:
-        try:
-            result = check_func()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = []
+        for name, check_func in checks:
+            report = Reporter()
+            futures.append((name, report, executor.submit(check_func, report)))
+        for name, report, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                report.line(f"\n❌ Error in {name}: {e}")
+                result = False
+            report.flush()
             results.append((name, result))
-        except Exception as e:
-            print(f"\n❌ Error in {name}: {e}")
-            results.append((name, False))
     
     # Summary
     print("\n" + "=" * 60)